@@ -85,9 +85,10 @@ The :py:class:`PID` class
 
 from __future__ import annotations
 
-import abc
 from enum import Enum, auto
-from typing import List, Union
+from typing import Dict, List, Sequence, Union
+
+from ._version import __version__
 
 # We're going to be calling int.to_bytes and int.from_bytes a LOT
 # These take a string argument 'big' or 'little', with other values raising
@@ -97,7 +98,8 @@ from typing import List, Union
 # Best practice is to use this whenever calling either of these functions.
 _LITTLE_ENDIAN = 'little'
 
-__version__ = '0.1'
+# Message for the several places an index can fall outside the PID table
+_ERR_PID_RANGE = 'PID index out of range'
 
 
 class PID:
@@ -109,6 +111,9 @@ class PID:
     :py:attr:`length`, a :py:class:`PID.PidLength` indicating the length of its
     corresponding parameter's value, and
     :py:attr:`is_extended`, indicating whether it is a page-1 or page-2 PID.
+
+    Instances are shared: constructing a :py:class:`PID` with an index that has
+    been seen before returns the same object, so ``PID(i) is PID(i)``.
     """
 
     class PidLength(Enum):
@@ -129,28 +134,60 @@ class PID:
             :return: instance appropriate to representing this index.
             :raise ValueError: if index does not correspond to a valid length.
             """
-            if 0 <= i <= 127 or 256 <= i <= 383:
-                return PID.PidLength.SINGLE
-            elif 128 <= i <= 191 or 384 <= i <= 447:
-                return PID.PidLength.DOUBLE
-            elif 192 <= i <= 253 or 448 <= i <= 509:
-                return PID.PidLength.VARIABLE
-            elif i == 254 or i == 510:
-                return PID.PidLength.DLESCAPE
-            else:
-                raise ValueError('PID index out of range')
-
-    def __init__(self, i: int):
-        """
-        :param i: index of this PID, in the range [0..510] (excluding 255)
-        """
+            # negative indices would otherwise wrap around the table
+            if i < 0:
+                raise ValueError(_ERR_PID_RANGE)
+            try:
+                length = _PID_LENGTH_TABLE[i]
+            except IndexError:
+                raise ValueError(_ERR_PID_RANGE) from None
+            if length is None:
+                raise ValueError(_ERR_PID_RANGE)
+            return length
+
+    __slots__ = ('_i', '_bytes', '_is_extended', '_length')
+
+    # instances already constructed, keyed by index; each subclass gets its own
+    _cache: Dict[int, PID] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cache = {}
+
+    def __new__(cls, i: int):
+        # validated before the cache lookup, so that e.g. 4.0 is refused
+        # whether or not PID(4) already exists
+        if not isinstance(i, int):
+            raise TypeError(f'PID index must be int, not {type(i).__name__}')
         if not 0 <= i <= 511:
             raise ValueError(f'{i} out of range for PID')
         elif i == 255:
             raise ValueError('PID 255 should not be instantiated')
         elif i == 511:
             raise ValueError('Page 2 extension is not supported')
-        self._i = i
+
+        hit = cls._cache.get(i)
+        if hit is not None:
+            return hit
+
+        obj = super().__new__(cls)
+        obj._i = i
+        obj._bytes = (i % 256).to_bytes(1, _LITTLE_ENDIAN)
+        obj._is_extended = i > 255
+        obj._length = PID.PidLength.from_i(i)
+        cls._cache[i] = obj
+        return obj
+
+    def __init__(self, i: int):
+        """
+        :param i: index of this PID, in the range [0..510] (excluding 255)
+        """
+        # all state is set up once, in __new__
+
+    def __reduce__(self):
+        # __new__ requires the index, and going through the constructor also
+        # keeps PID(i) is PID(i) across pickling and copying
+        return type(self), (self._i,)
 
     def to_bytes(self) -> bytes:
         """
@@ -166,7 +203,7 @@ class PID:
            see the messaging format and/or implementation of
            :py:meth:`Message.to_bytes` for why.
         """
-        return (self._i % 256).to_bytes(1, _LITTLE_ENDIAN)
+        return self._bytes
 
     @property
     def i(self) -> int:
@@ -176,21 +213,47 @@ class PID:
     @property
     def is_extended(self) -> bool:
         """True if this is a page-2 PID, False if it is page-1"""
-        return self.i > 255
+        return self._is_extended
 
     @property
     def length(self) -> PID.PidLength:
         """Length of this PID's value"""
-        return PID.PidLength.from_i(self.i)
+        return self._length
 
 
-class Parameter(abc.ABC):
+# The PidLength members, bound once for identity checks in constructors.
+_SINGLE = PID.PidLength.SINGLE
+_DOUBLE = PID.PidLength.DOUBLE
+_VARIABLE = PID.PidLength.VARIABLE
+_DLESCAPE = PID.PidLength.DLESCAPE
+
+
+def _build_pid_length_table() -> tuple:
+    """
+    Build the lookup table used by :py:meth:`PID.PidLength.from_i`, indexed by
+    PID index over [0..511], with ``None`` marking indices that have no length.
+    """
+    table = [None] * 512
+    for page in (0, 256):
+        for lo, hi, length in ((0, 127, _SINGLE),
+                               (128, 191, _DOUBLE),
+                               (192, 253, _VARIABLE),
+                               (254, 254, _DLESCAPE)):
+            for i in range(page + lo, page + hi + 1):
+                table[i] = length
+    return tuple(table)
+
+
+_PID_LENGTH_TABLE = _build_pid_length_table()
+
+
+class Parameter:
     """
     Representation of a "Parameter", that is, a combination of a PID and a
     value.
 
-    For reasons described above, this class inherits :py:class:`abc.ABC` and
-    should not be instantiated by itself.
+    For reasons described above, this class is abstract and should not be
+    instantiated by itself; attempting to do so raises :py:exc:`TypeError`.
     Instead, use one of its subclasses below.
 
     :py:attr:`value` is stored and returned as :py:class:`bytes`, since
@@ -200,11 +263,21 @@ class Parameter(abc.ABC):
     Future versions might include convenience methods for casting this, though
     doing so from the :py:class:`bytes` object is not difficult.
     """
+
+    __slots__ = ('_pid', '_value', '_varlength', '_encoded', '_is_extended')
+
     def __init__(self,
                  pid: PID,
                  value: bytes,
                  length: int):
 
+        # abstractness is enforced here rather than through abc.ABCMeta, whose
+        # Python-level __instancecheck__ would slow down the per-parameter
+        # isinstance checks in Message.check_parameters
+        if type(self) is Parameter:
+            raise TypeError(f'{Parameter.__name__} is abstract and cannot be '
+                            f'instantiated directly')
+
         if len(value) > length:
             raise ValueError(f'value {value} exceeds length {length} of '
                              f'"{self.__class__.__name__}" instance')
@@ -212,6 +285,19 @@ class Parameter(abc.ABC):
         self._pid = pid
         self._value = value
         self._varlength = length
+        # hoisted from the PID for Message.check_parameters
+        self._is_extended = pid.is_extended
+
+    def __getstate__(self):
+        # with __slots__ there is no __dict__, and pickle protocols 0 and 1
+        # (and, before Python 3.11, copying) would otherwise lose the state
+        return {name: getattr(self, name)
+                for cls in type(self).__mro__
+                for name in getattr(cls, '__slots__', ())}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @property
     def pid(self) -> PID:
@@ -223,14 +309,13 @@ class Parameter(abc.ABC):
         """Value of the parameter"""
         return self._value
 
-    @abc.abstractmethod
     def to_bytes(self) -> bytes:
         """
         :return: :py:class:`bytes` representation of the Parameter, including the LSB
                  of the PID, the value, and any interstitial characters required
                  by the specific type.
         """
-        pass  # b/c abstract
+        raise NotImplementedError  # b/c abstract
 
 
 class FixedLengthParameter(Parameter):
@@ -243,23 +328,30 @@ class FixedLengthParameter(Parameter):
     :paramref:`pid` and, if necessary will be left-padded with zeros to make up
     this length in the return of :py:meth:`to_bytes`.
     """
+
+    __slots__ = ()
+
     def __init__(self, pid: PID, value: bytes):
 
-        if pid.length is PID.PidLength.SINGLE:
+        length = pid.length
+        if length is _SINGLE:
             super().__init__(pid, value, 1)
-        elif pid.length is PID.PidLength.DOUBLE:
+        elif length is _DOUBLE:
             super().__init__(pid, value, 2)
-        elif pid.length is PID.PidLength.VARIABLE:
+        elif length is _VARIABLE:
             raise ValueError('variable-length parameters should use class'
-                             'VariableLengthParameter')
-        elif pid.length is PID.PidLength.DLESCAPE:
+                             f' {VariableLengthParameter.__name__}')
+        elif length is _DLESCAPE:
             raise ValueError('data link parameters should use class'
                              f' {DataLinkEscapeParameter.__name__}')
         else:
             raise RuntimeError('should be unreachable')
 
+        pad = b'\x00' * (self._varlength - len(value))
+        self._encoded = pid.to_bytes() + pad + value
+
     def to_bytes(self) -> bytes:
-        return self.pid.to_bytes() + self.value.rjust(self._varlength, b'\x00')
+        return self._encoded
 
 
 class VariableLengthParameter(Parameter):
@@ -272,13 +364,18 @@ class VariableLengthParameter(Parameter):
                    If greater, :paramref:`value` will be zero-left-padded in the
                    return of :py:meth:`to_bytes` to make up the difference.
                    If not specified, defaults to ``len(value)``.
+                   In either case, must not exceed 255, since the length is
+                   sent as a single byte.
     """
+
+    __slots__ = ()
+
     def __init__(self,
                  pid: PID,
                  value: bytes,
                  length: Union[int, None] = None):
 
-        if pid.length is not PID.PidLength.VARIABLE:
+        if pid.length is not _VARIABLE:
             raise ValueError(f'{self.__class__.__name__} instance must '
                              f'have VARIABLE length PID')
 
@@ -290,9 +387,15 @@ class VariableLengthParameter(Parameter):
         else:
             super().__init__(pid, value, len(value))
 
+        if self._varlength > 255:
+            raise ValueError(f'length {self._varlength} cannot be '
+                             f'represented in a single byte')
+        length_bytes = self._varlength.to_bytes(1, _LITTLE_ENDIAN)
+        pad = b'\x00' * (self._varlength - len(value))
+        self._encoded = pid.to_bytes() + length_bytes + pad + value
+
     def to_bytes(self) -> bytes:
-        length = self._varlength.to_bytes(1, _LITTLE_ENDIAN)
-        return self.pid.to_bytes() + length + self.value
+        return self._encoded
 
 
 class DataLinkEscapeParameter(Parameter):
@@ -306,12 +409,15 @@ class DataLinkEscapeParameter(Parameter):
 
     :param addressee: MID of addressee
     """
+
+    __slots__ = ('_addressee',)
+
     def __init__(self,
                  pid: PID,
                  addressee: int,
                  value: bytes):
 
-        if pid.length is not PID.PidLength.DLESCAPE:
+        if pid.length is not _DLESCAPE:
             raise ValueError(f'{self.__class__.__name__} instance must '
                              f'have ESCAPE PID')
 
@@ -320,6 +426,8 @@ class DataLinkEscapeParameter(Parameter):
 
         super().__init__(pid, value, len(value))
         self._addressee = addressee
+        addressee_bytes = addressee.to_bytes(1, _LITTLE_ENDIAN)
+        self._encoded = pid.to_bytes() + addressee_bytes + value
 
     @property
     def addressee(self) -> int:
@@ -327,8 +435,7 @@ class DataLinkEscapeParameter(Parameter):
         return self._addressee
 
     def to_bytes(self) -> bytes:
-        addresseebytes = self.addressee.to_bytes(1, _LITTLE_ENDIAN)
-        return self.pid.to_bytes() + addresseebytes + self.value
+        return self._encoded
 
 
 class Message:
@@ -350,6 +457,10 @@ class Message:
     Thus, it's not guaranteed that a general instance will successfully return
     :py:meth:`to_bytes`, and there's no easier way to check than by attempting
     such a call.
+
+    Once the parameters are final, :py:meth:`freeze` can be called to validate
+    and encode the message once, so that later calls to :py:meth:`to_bytes`
+    (*e.g.* when retransmitting it) return the stored result.
     """
 
     def __init__(self,
@@ -359,8 +470,11 @@ class Message:
         if not 0 <= mid <= 255:
             raise ValueError(f'{mid} out of range for MID')
         self._mid = mid
+        self._mid_bytes = mid.to_bytes(1, _LITTLE_ENDIAN)
 
         self._parameters = parameters
+        # set by freeze()
+        self._encoded = None
 
     @property
     def mid(self) -> int:
@@ -370,13 +484,31 @@ class Message:
     @property
     def mid_as_bytes(self) -> bytes:
         """MID of the message as :py:class:`bytes`"""
-        return self.mid.to_bytes(1, _LITTLE_ENDIAN)
+        return self._mid_bytes
 
     @property
-    def parameters(self) -> List[Parameter]:
-        """List of :py:class:`Parameter` s in this message"""
+    def parameters(self) -> Sequence[Parameter]:
+        """
+        List of :py:class:`Parameter` s in this message, or a tuple of them
+        once the message has been frozen
+        """
         return self._parameters
 
+    def freeze(self) -> Message:
+        """
+        Validates and encodes this message, then fixes :py:attr:`parameters` as
+        a tuple so that the encoding cannot go stale.
+        Subsequent calls to :py:meth:`to_bytes` return the stored encoding.
+
+        :return: this instance, to allow chaining from the constructor.
+        :raises ValueError: for the same reasons as :py:meth:`to_bytes`, in
+            which case the message is left unfrozen.
+        """
+        encoded = self.to_bytes()
+        self._parameters = tuple(self._parameters)
+        self._encoded = encoded
+        return self
+
     def to_bytes(self) -> bytes:
         """
         Calculates and returns :py:class:`bytes` representation of this message,
@@ -384,25 +516,113 @@ class Message:
 
         This calls :py:meth:`check_parameters` and will fail for any of the
         reasons listed there if :py:attr:`parameters` is invalid.
-        It also calls :py:meth:`append_checksum` and will fail if
+        Like :py:meth:`append_checksum`, it will fail if
         :py:attr:`parameters` would lead to a message of length exceeding the
         allowed 21 bytes.
+        If the message has been frozen with :py:meth:`freeze`, the stored
+        encoding is returned instead and none of this is repeated.
 
         :return: representation of this message suitable for passing to pyserial
             or whatever.
         :raises ValueError: according to the behavior of
             :py:meth:`check_parameters` and :py:meth:`append_checksum`.
         """
-        contents = (self.mid_as_bytes
-                    + (b'\xff'
-                       if self.check_parameters(self.parameters)
-                       else b'')
-                    + b''.join(parameter.to_bytes()
-                               for parameter in self.parameters))
-        return self.append_checksum(contents)
+        if self._encoded is not None:
+            return self._encoded
+
+        parameters = self._parameters
+        extended = self.check_parameters(parameters)
+
+        # assembled in place, rather than by concatenating bytes objects
+        buf = bytearray(self._mid_bytes)
+        if extended:
+            buf.append(0xff)
+        for parameter in parameters:
+            buf += parameter.to_bytes()
+
+        l = len(buf)
+        if l > 20:
+            raise ValueError(f'"{bytes(buf)}" (length {l}) exceeds max '
+                             f'length 20')
+        buf.append(self.calc_checksum(buf))
+        return bytes(buf)
+
+    @classmethod
+    def from_bytes(cls, s: bytes) -> Message:
+        """
+        Parses a single message, as returned by :py:meth:`to_bytes`.
+
+        The checksum is verified and stripped first; the remainder is then
+        walked once, with each parameter's PID determining how many of the
+        following bytes belong to it.
+
+        :param s: :py:class:`bytes` of one complete message, including its
+            checksum.
+        :return: the parsed message.
+            Its :py:attr:`parameters` are of the appropriate
+            :py:class:`Parameter` subclass for each PID.
+            Any zero padding of a value is kept as part of that value, so the
+            parsed parameters encode to the same bytes as the originals.
+        :raises ValueError: if :paramref:`s` is too long, has an incorrect
+            checksum, contains no parameters, contains an invalid PID, or ends
+            partway through a parameter.
+        """
+        l = len(s)
+        if l > 21:
+            raise ValueError(f'"{s}" (length {l}) exceeds max length 21')
+        body = cls.strip_checksum(s)
+        end = len(body)
+        if end < 2:
+            raise ValueError(f'Error parsing "{s}": no parameters found')
+
+        mid = body[0]
+        if body[1] == 0xff:
+            page = 256
+            pos = 2
+        else:
+            page = 0
+            pos = 1
+
+        parameters = []
+        while pos < end:
+            pid = PID(page + body[pos])
+            pos += 1
+            length = pid.length
+            if pos >= end:
+                # every parameter type needs at least one byte after its PID
+                raise ValueError(f'Error parsing "{s}": message ends partway '
+                                 f'through a parameter')
+
+            if length is _SINGLE:
+                n = 1
+            elif length is _DOUBLE:
+                n = 2
+            elif length is _VARIABLE:
+                n = body[pos]
+                pos += 1
+            else:
+                # the data link escape claims all remaining bytes
+                parameters.append(
+                    DataLinkEscapeParameter(pid, body[pos], body[pos + 1:]))
+                pos = end
+                break
+
+            value = body[pos:pos + n]
+            pos += n
+            if pos > end:
+                break  # truncated value
+            if length is _VARIABLE:
+                parameters.append(VariableLengthParameter(pid, value))
+            else:
+                parameters.append(FixedLengthParameter(pid, value))
+
+        if pos != end or not parameters:
+            raise ValueError(f'Error parsing "{s}": message ends partway '
+                             f'through a parameter')
+        return cls(mid, parameters)
 
     @staticmethod
-    def check_parameters(parameters: List[Parameter]) -> bool:
+    def check_parameters(parameters: Sequence[Parameter]) -> bool:
         """Checks that the following conditions are met:
 
         1) :paramref:`parameters` is nonempty
@@ -419,29 +639,26 @@ class Message:
         if not parameters:
             raise ValueError
 
-        if not all(isinstance(parameter, Parameter)
-                   for parameter in parameters):
-            raise ValueError('non-Parameter instance found in list')
-
-        is_dles = [isinstance(parameter, DataLinkEscapeParameter)
-                   for parameter in parameters]
-        if any(is_dles):
-            # if we're here, we have at least one DLE.
-            # Thus we require the last element be a DLE.
-            # If there is more than one, at least one of those is not the last
-            # element.
-            if not is_dles[-1] or sum(is_dles) > 1:
+        # All conditions are checked in a single pass.
+        # A DLE anywhere but the last position violates (4); this also covers
+        # the case of more than one DLE, since at most one can be last.
+        last = len(parameters) - 1
+        extended = 0
+        for index, parameter in enumerate(parameters):
+            if not isinstance(parameter, Parameter):
+                raise ValueError('non-Parameter instance found in list')
+            if (isinstance(parameter, DataLinkEscapeParameter)
+                    and index != last):
                 raise ValueError(f'{DataLinkEscapeParameter.__name__} must be '
                                  f'last parameter in list.')
-
-        allare = all((parameter.pid.is_extended
-                      for parameter in parameters))
-        noneare = all((not parameter.pid.is_extended
-                       for parameter in parameters))
-
-        if allare or noneare:
-            return allare
-        raise ValueError('Cannot mix extended and unextended parameters in'
+            if parameter._is_extended:
+                extended += 1
+
+        if extended == 0:
+            return False
+        if extended == last + 1:
+            return True
+        raise ValueError('Cannot mix extended and unextended parameters in '
                          'same message')
 
     @staticmethod
@@ -453,7 +670,7 @@ class Message:
         :param s: :py:class:`bytes` in
         :return: the checksum
         """
-        return -sum(memoryview(s)) % 256
+        return -sum(s) & 0xff
 
     @classmethod
     def append_checksum(cls, s: bytes) -> bytes:
@@ -475,12 +692,24 @@ class Message:
 
     @classmethod
     def strip_checksum(cls, s: bytes) -> bytes:
-        # TODO doc, test
-        head = s[:-1]
-        expected_checksum = cls.calc_checksum(head)
-        provided_checksum = s[-1]
-        if expected_checksum != provided_checksum:
+        """
+        Verifies the checksum that terminates `s` and returns the remainder.
+
+        Since the checksum is the two's complement of the sum of the preceding
+        bytes, a correct message sums to zero (modulo 256) as a whole, so this
+        is checked without first separating the checksum from its contents.
+
+        :param s: :py:class:`bytes` in, including its trailing checksum
+        :return: :paramref:`s` without its checksum.
+            This will have length 1 less than :paramref:`s`.
+        :raises ValueError: if :paramref:`s` is empty or the checksum does not
+            match.
+        """
+        if not s:
+            raise ValueError('cannot strip checksum from empty message')
+        if sum(s) & 0xff:
+            head = s[:-1]
             raise ValueError(f'Error parsing "{s}": '
-                             f'provided checksum {provided_checksum} differs'
-                             f'from expected value {expected_checksum}')
-        return head
+                             f'provided checksum {s[-1]} differs '
+                             f'from expected value {cls.calc_checksum(head)}')
+        return s[:-1]
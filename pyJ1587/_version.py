@@ -0,0 +1,3 @@
+# Kept in its own module so that the build can read it without importing the
+# package.
+__version__ = '0.1'
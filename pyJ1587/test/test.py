@@ -1,71 +1,178 @@
+import copy
+import pickle
+import random
 import unittest.mock
 
 import pyJ1587 as dut
 
 
+# NEGATED_BYTES[n] is the byte that brings a running sum of n to 0 (mod 256),
+# i.e. the expected checksum of any string whose sum is n (mod 256)
+NEGATED_BYTES = bytes((256 - n) % 256 for n in range(256))
+
+# (s, checksum of s, s with checksum appended)
+CHECKSUM_FIXTURES = [
+    (b'\x00', 0x00, b'\x00\x00'),
+    (b'\x01', 0xff, b'\x01\xff'),
+    (b'\xff', 0x01, b'\xff\x01'),
+    (b'\x00\x01', 0xff, b'\x00\x01\xff'),
+    (b'\x01\x00', 0xff, b'\x01\x00\xff'),
+    (b'\x01\x01', 0xfe, b'\x01\x01\xfe'),
+    (b'\xfe\x01\x01', 0x00, b'\xfe\x01\x01\x00'),
+]
+
+# strings terminated by an incorrect checksum
+BAD_CHECKSUM_CASES = [
+    b'\x00\x01',
+    b'\x00\xff',
+    b'\x01\xfe',
+    b'\xff\x11',
+    b'\x00\x01\x69',
+    b'\x01\x00\xfe',
+    b'\x01\x01\xff',
+    b'\xfe\x01\x01\x01',
+]
+
+
 class TestPID(unittest.TestCase):
 
-    SINGLE_LENGTH_PIDS = [0, 1, 12, 127, 256, 383]
-    DOUBLE_LENGTH_PIDS = [128, 191, 384, 447]
-    VARIABLE_LENGTH_PIDS = [192, 253, 448, 509]
-    DLESCAPE_PIDS = [254, 510]
-    UNEXTENDED_PIDS = [0, 1, 12, 254]
-    EXTENDED_PIDS = [256, 257, 510]
+    SINGLE_LENGTH_PIDS = (0, 1, 12, 127, 256, 383)
+    DOUBLE_LENGTH_PIDS = (128, 191, 384, 447)
+    VARIABLE_LENGTH_PIDS = (192, 253, 448, 509)
+    DLESCAPE_PIDS = (254, 510)
+    UNEXTENDED_PIDS = (0, 1, 12, 254)
+    EXTENDED_PIDS = (256, 257, 510)
+
+    # PIDs that each Parameter subclass should refuse
+    BAD_FOR_FIXED = VARIABLE_LENGTH_PIDS + DLESCAPE_PIDS
+    BAD_FOR_VARIABLE = DLESCAPE_PIDS + DOUBLE_LENGTH_PIDS + SINGLE_LENGTH_PIDS
+    BAD_FOR_DLESCAPE = (SINGLE_LENGTH_PIDS + DOUBLE_LENGTH_PIDS
+                        + VARIABLE_LENGTH_PIDS)
 
     def test_i_works(self):
         for i in [0, 1, 12, 254, 256, 257, 510]:
-            pid = dut.PID(i)
-            self.assertEqual(pid.i, i)
+            with self.subTest(i=i):
+                pid = dut.PID(i)
+                self.assertEqual(pid.i, i)
 
     def test_exception_i_out_of_range(self):
         for i in [-1, 512, 39847]:
-            with self.assertRaises(ValueError):
+            with self.subTest(i=i), self.assertRaises(ValueError):
                 dut.PID(i)
 
     def test_exception_i_forbidden(self):
         for i in [255, 511]:
-            with self.assertRaises(ValueError):
+            with self.subTest(i=i), self.assertRaises(ValueError):
                 dut.PID(i)
 
     def test_is_extended(self):
         for i in self.UNEXTENDED_PIDS:
-            pid = dut.PID(i)
-            self.assertFalse(pid.is_extended)
+            with self.subTest(i=i):
+                pid = dut.PID(i)
+                self.assertFalse(pid.is_extended)
         for i in self.EXTENDED_PIDS:
-            pid = dut.PID(i)
-            self.assertTrue(pid.is_extended)
+            with self.subTest(i=i):
+                pid = dut.PID(i)
+                self.assertTrue(pid.is_extended)
 
     def test_to_bytes(self):
-        for i, b in [
+        cases = [
             (0, b'\x00'),
             (1, b'\x01'),
             (0xfe, b'\xfe'),
             (0x0100, b'\x00'),
             (0x0101, b'\x01'),
             (0x01fe, b'\xfe'),
-        ]:
-            pid = dut.PID(i)
-            self.assertEqual(pid.to_bytes(), b)
+        ]
+        self.assertListEqual([dut.PID(i).to_bytes() for i, _ in cases],
+                             [b for _, b in cases])
 
     def test_length(self):
-        for i in self.SINGLE_LENGTH_PIDS:
-            pid = dut.PID(i)
-            self.assertIs(pid.length, dut.PID.PidLength.SINGLE)
-        for i in self.DOUBLE_LENGTH_PIDS:
-            pid = dut.PID(i)
-            self.assertIs(pid.length, dut.PID.PidLength.DOUBLE)
-        for i in self.VARIABLE_LENGTH_PIDS:
-            pid = dut.PID(i)
-            self.assertIs(pid.length, dut.PID.PidLength.VARIABLE)
-        for i in self.DLESCAPE_PIDS:
-            pid = dut.PID(i)
-            self.assertIs(pid.length, dut.PID.PidLength.DLESCAPE)
+        cases = [
+            (self.SINGLE_LENGTH_PIDS, dut.PID.PidLength.SINGLE),
+            (self.DOUBLE_LENGTH_PIDS, dut.PID.PidLength.DOUBLE),
+            (self.VARIABLE_LENGTH_PIDS, dut.PID.PidLength.VARIABLE),
+            (self.DLESCAPE_PIDS, dut.PID.PidLength.DLESCAPE),
+        ]
+        self.assertListEqual(
+            [dut.PID(i).length for pids, _ in cases for i in pids],
+            [length for pids, length in cases for _ in pids])
 
     def test_unreachable(self):
-        pid = dut.PID(0)
-        pid._i = 1234
         with self.assertRaises(ValueError):
-            _ = pid.length
+            dut.PID.PidLength.from_i(1234)
+
+    def test_shared(self):
+        for i in [0, 1, 12, 254, 256, 257, 510]:
+            with self.subTest(i=i):
+                self.assertIs(dut.PID(i), dut.PID(i))
+
+    def test_subclass(self):
+        # a subclass should neither receive nor hand out base-class instances
+        for i in [0, 1, 12, 254, 256, 257, 510]:
+            with self.subTest(i=i):
+                pid = dut.PID(i)
+                sub = _SubPID(i)
+                self.assertIs(type(sub), _SubPID)
+                self.assertIs(_SubPID(i), sub)
+                self.assertIs(dut.PID(i), pid)
+                self.assertIs(pickle.loads(pickle.dumps(sub)), sub)
+
+    def test_exception_i_not_int(self):
+        # refused the same way whether or not PID(4) has been built already
+        for cached in [False, True]:
+            with self.subTest(cached=cached):
+                if cached:
+                    dut.PID(4)
+                with self.assertRaises(TypeError):
+                    dut.PID(4.0)
+
+    def test_pickle_and_copy(self):
+        protocols = range(pickle.HIGHEST_PROTOCOL + 1)
+        for i in [0, 1, 12, 254, 256, 257, 510]:
+            pid = dut.PID(i)
+            for protocol in protocols:
+                with self.subTest(i=i, protocol=protocol):
+                    self.assertIs(
+                        pickle.loads(pickle.dumps(pid, protocol)), pid)
+            with self.subTest(i=i):
+                self.assertIs(copy.copy(pid), pid)
+                self.assertIs(copy.deepcopy(pid), pid)
+
+        # and for the objects that hold a PID
+        msg = dut.Message(0x80, [
+            dut.FixedLengthParameter(dut.PID(0x84), b'\x01\x02'),
+            dut.VariableLengthParameter(dut.PID(0xc0), b'ab'),
+            dut.DataLinkEscapeParameter(dut.PID(254), 0x20, b'xy'),
+        ])
+        clones = [(protocol, pickle.loads(pickle.dumps(msg, protocol)))
+                  for protocol in protocols]
+        clones.append(('deepcopy', copy.deepcopy(msg)))
+        for how, clone in clones:
+            with self.subTest(how=how):
+                self.assertEqual(clone.to_bytes(), msg.to_bytes())
+                self.assertIs(clone.parameters[0].pid, dut.PID(0x84))
+                self.assertEqual(clone.parameters[2].addressee, 0x20)
+
+
+class _SubPID(dut.PID):
+    """Trivial subclass, for checking that PID instances keep their type."""
+
+
+class _ConcreteParameter(dut.Parameter):
+    """Minimal subclass allowing the base class to be instantiated."""
+
+    def to_bytes(self) -> bytes:
+        return b''
+
+
+class _BadPidsMixin:
+    """Shared check for Parameter subclasses refusing unsuitable PIDs."""
+
+    def _assert_all_raise(self, ctor, bad_pids, *extra):
+        for i in bad_pids:
+            with self.subTest(i=i), self.assertRaises(ValueError):
+                ctor(dut.PID(i), *extra)
 
 
 class TestParameter(unittest.TestCase):
@@ -76,150 +183,239 @@ class TestParameter(unittest.TestCase):
             pid = dut.PID(23)
             dut.Parameter(pid, b'', 0)
 
-    # decorator to mock abstract methods to allow direct instantiation
-    unabstract = unittest.mock.patch.multiple(
-        dut.Parameter, __abstractmethods__=set())
-
-    @unabstract
     def test_properties(self):
         pid = dut.PID(23)
         value = b'j'
-        parameter = dut.Parameter(pid, value, 1)
+        parameter = _ConcreteParameter(pid, value, 1)
         self.assertIs(parameter.pid, pid)
         self.assertIs(parameter.value, value)
 
-    @unabstract
     def test_length_check(self):
         with self.assertRaises(ValueError):
-            dut.Parameter(dut.PID(0), b'abc', 1)
+            _ConcreteParameter(dut.PID(0), b'abc', 1)
 
 
-class TestFixedLengthParameter(unittest.TestCase):
+class TestFixedLengthParameter(_BadPidsMixin, unittest.TestCase):
 
     def test_lengths(self):
         for i in TestPID.SINGLE_LENGTH_PIDS:
-            parameter = dut.FixedLengthParameter(dut.PID(i), b'8')
-            self.assertEqual(parameter._varlength, 1)
+            with self.subTest(i=i):
+                parameter = dut.FixedLengthParameter(dut.PID(i), b'8')
+                self.assertEqual(parameter._varlength, 1)
         for i in TestPID.DOUBLE_LENGTH_PIDS:
-            parameter = dut.FixedLengthParameter(dut.PID(i), b'88')
-            self.assertEqual(parameter._varlength, 2)
+            with self.subTest(i=i):
+                parameter = dut.FixedLengthParameter(dut.PID(i), b'88')
+                self.assertEqual(parameter._varlength, 2)
 
     def test_bad_pids(self):
-        for i in [*TestPID.VARIABLE_LENGTH_PIDS,
-                  *TestPID.DLESCAPE_PIDS]:
-            with self.assertRaises(ValueError):
-                dut.FixedLengthParameter(dut.PID(i), b'')
-
-    @unittest.mock.patch('pyJ1587.PID', length=None)
-    def test_unreachable(self, PID):
-        pid = PID(0)
+        self._assert_all_raise(dut.FixedLengthParameter,
+                               TestPID.BAD_FOR_FIXED, b'')
+
+    def test_unreachable(self):
+        pid = unittest.mock.Mock(spec=dut.PID, length=None)
         with self.assertRaises(RuntimeError):
             dut.FixedLengthParameter(pid, b'')
 
     def test_to_bytes(self):
-        for i, v, b in [
+        cases = [
             (0x00, b'3', b'\x003'),
             (0x69, b'3', b'\x693'),
             (0x0100, b'h', b'\x00h'),
             (0x80, b'yi', b'\x80yi'),
             (0x0182, b'39', b'\x8239'),
-        ]:
-            self.assertEqual(dut.FixedLengthParameter(
-                dut.PID(i), v).to_bytes(),
-                             b)
+        ]
+        self.assertListEqual(
+            [dut.FixedLengthParameter(dut.PID(i), v).to_bytes()
+             for i, v, _ in cases],
+            [b for _, _, b in cases])
 
     def test_formatted_lengths(self):
         for i in TestPID.SINGLE_LENGTH_PIDS:
-            parameter = dut.FixedLengthParameter(dut.PID(i), b'8')
-            self.assertEqual(len(parameter.to_bytes()), 2)
+            with self.subTest(i=i):
+                parameter = dut.FixedLengthParameter(dut.PID(i), b'8')
+                self.assertEqual(len(parameter.to_bytes()), 2)
         # when given a single byte, double-length parameters should still
         # return 3
         for i in TestPID.DOUBLE_LENGTH_PIDS:
-            parameter = dut.FixedLengthParameter(dut.PID(i), b'8')
-            self.assertEqual(len(parameter.to_bytes()), 3)
+            with self.subTest(i=i, value=b'8'):
+                parameter = dut.FixedLengthParameter(dut.PID(i), b'8')
+                self.assertEqual(len(parameter.to_bytes()), 3)
         for i in TestPID.DOUBLE_LENGTH_PIDS:
-            parameter = dut.FixedLengthParameter(dut.PID(i), b'88')
-            self.assertEqual(len(parameter.to_bytes()), 3)
+            with self.subTest(i=i, value=b'88'):
+                parameter = dut.FixedLengthParameter(dut.PID(i), b'88')
+                self.assertEqual(len(parameter.to_bytes()), 3)
 
 
-class TestVariableLengthParameter(unittest.TestCase):
+class TestVariableLengthParameter(_BadPidsMixin, unittest.TestCase):
 
     def test_bad_pids(self):
-        for i in [*TestPID.DLESCAPE_PIDS,
-                  *TestPID.DOUBLE_LENGTH_PIDS,
-                  *TestPID.SINGLE_LENGTH_PIDS]:
-            with self.assertRaises(ValueError):
-                dut.VariableLengthParameter(dut.PID(i), b'', None)
+        self._assert_all_raise(dut.VariableLengthParameter,
+                               TestPID.BAD_FOR_VARIABLE, b'', None)
 
-    def test_length_specified_and_overruns(self):
+    def test_length_specified(self):
         pid = dut.PID(TestPID.VARIABLE_LENGTH_PIDS[0])
-        with self.assertRaises(ValueError):
-            dut.VariableLengthParameter(pid, b'1234', 3)
-
-    def test_length_specified_and_equal(self):
+        # (specified length, whether it is shorter than the 4-byte value)
+        for length, overruns in [(3, True), (4, False), (5, False)]:
+            with self.subTest(length=length):
+                if overruns:
+                    with self.assertRaises(ValueError):
+                        dut.VariableLengthParameter(pid, b'1234', length)
+                else:
+                    m = dut.VariableLengthParameter(pid, b'1234', length)
+                    self.assertEqual(m._varlength, length)
+
+    def test_length_unrepresentable(self):
         pid = dut.PID(TestPID.VARIABLE_LENGTH_PIDS[0])
-        m = dut.VariableLengthParameter(pid, b'1234', 4)
-        self.assertEqual(m._varlength, 4)
-
-    def test_length_specified_and_underruns(self):
-        pid = dut.PID(TestPID.VARIABLE_LENGTH_PIDS[0])
-        m = dut.VariableLengthParameter(pid, b'1234', 5)
-        self.assertEqual(m._varlength, 5)
+        with self.assertRaises(ValueError):
+            dut.VariableLengthParameter(pid, b'1234', 256)
+        with self.assertRaises(ValueError):
+            dut.VariableLengthParameter(pid, b'1' * 256)
 
     def test_to_bytes(self):
-        for i, v, b in [
-            (0xc0, b'3', b'\xc0\x013'),
-            (0xc1, b'34', b'\xc1\x0234'),
-        ]:
-            self.assertEqual(dut.VariableLengthParameter(
-                dut.PID(i), v).to_bytes(),
-                             b)
+        cases = [
+            (0xc0, b'3', None, b'\xc0\x013'),
+            (0xc1, b'34', None, b'\xc1\x0234'),
+            # a declared length longer than the value is made up with zeros
+            (0xc0, b'34', 4, b'\xc0\x04\x00\x0034'),
+        ]
+        self.assertListEqual(
+            [dut.VariableLengthParameter(dut.PID(i), v, length).to_bytes()
+             for i, v, length, _ in cases],
+            [b for _, _, _, b in cases])
 
 
-class TestDataLinkEscapeParameter(unittest.TestCase):
+class TestDataLinkEscapeParameter(_BadPidsMixin, unittest.TestCase):
 
     def test_bad_pids(self):
-        for i in [*TestPID.SINGLE_LENGTH_PIDS,
-                  *TestPID.DOUBLE_LENGTH_PIDS,
-                  *TestPID.VARIABLE_LENGTH_PIDS]:
-            with self.assertRaises(ValueError):
-                dut.DataLinkEscapeParameter(dut.PID(i), 127, b'')
+        self._assert_all_raise(dut.DataLinkEscapeParameter,
+                               TestPID.BAD_FOR_DLESCAPE, 127, b'')
 
     def test_bad_addressee(self):
         for pid in TestPID.DLESCAPE_PIDS:
             for addressee in [-1, 256, 999]:
-                with self.assertRaises(ValueError):
+                with self.subTest(pid=pid, addressee=addressee), \
+                        self.assertRaises(ValueError):
                     dut.DataLinkEscapeParameter(dut.PID(pid), addressee, b'')
 
     def test_addressee(self):
         for pid in TestPID.DLESCAPE_PIDS:
             for addressee in [0, 1, 69, 254, 255]:
-                parameter = dut.DataLinkEscapeParameter(
-                    dut.PID(pid), addressee, b'')
-                self.assertEqual(parameter.addressee, addressee)
+                with self.subTest(pid=pid, addressee=addressee):
+                    parameter = dut.DataLinkEscapeParameter(
+                        dut.PID(pid), addressee, b'')
+                    self.assertEqual(parameter.addressee, addressee)
 
     def test_to_bytes(self):
-        for i, addressee, payload, value in [
+        cases = [
             (254, 123, b'', b'\xfe\x7b'),
             (254, 123, b'payload', b'\xfe\x7bpayload'),
-        ]:
-            self.assertEqual(dut.DataLinkEscapeParameter(
-                dut.PID(i), addressee, payload).to_bytes(), value)
+        ]
+        self.assertListEqual(
+            [dut.DataLinkEscapeParameter(
+                dut.PID(i), addressee, payload).to_bytes()
+             for i, addressee, payload, _ in cases],
+            [value for _, _, _, value in cases])
 
 
 class TestMessage(unittest.TestCase):
 
-    def test_mid(self):
+    @classmethod
+    def setUpClass(cls):
+        # one parameter per PID used in the tests, built once
+        cls._param_by_pid = {
+            i: cls._parameter_from_pid(dut.PID(i))
+            for i in [*TestPID.SINGLE_LENGTH_PIDS,
+                      *TestPID.DOUBLE_LENGTH_PIDS,
+                      *TestPID.VARIABLE_LENGTH_PIDS,
+                      *TestPID.DLESCAPE_PIDS,
+                      *TestPID.UNEXTENDED_PIDS,
+                      *TestPID.EXTENDED_PIDS]
+        }
+
+        # parameter fixtures for test_check_parameters
+        cls._extended = [cls._param_by_pid[i]
+                         for i in TestPID.EXTENDED_PIDS]
+        cls._unextended = [cls._param_by_pid[i]
+                           for i in TestPID.UNEXTENDED_PIDS]
+        cls._single = cls._param_by_pid[TestPID.SINGLE_LENGTH_PIDS[0]]
+        cls._dlescape = cls._param_by_pid[TestPID.DLESCAPE_PIDS[0]]
+
+        # message fixtures for test_to_bytes and test_from_bytes.
+        # if we're going to catch regressions, here's where we're going to
+        # do it; special cases ahoy!
+        cls.test_cases = [
+            # single P1 single-length
+            (0,
+             [
+                 dut.FixedLengthParameter(dut.PID(1), b'\x88')
+             ],
+             b'\x00\x01\x88\x77'),
+            (1,
+             [
+                 dut.FixedLengthParameter(dut.PID(1), b'\x08')
+             ],
+             b'\x01\x01\x08\xf6'),
+            (0x0c,
+             [
+                 dut.FixedLengthParameter(dut.PID(1), b'\x88')
+             ],
+             b'\x0c\x01\x88\x6b'),
+            # double P1 single-length
+            (0,
+             [
+                 dut.FixedLengthParameter(dut.PID(1), b'\x88'),
+                 dut.FixedLengthParameter(dut.PID(1), b'\x88')
+             ],
+             b'\x00\x01\x88\x01\x88\xee'),
+            # single P2 single-length
+            (0x17,
+             [
+                 dut.FixedLengthParameter(dut.PID(0x0105), b'\x99')
+             ],
+             b'\x17\xff\x05\x99\x4c'),
+            # double P2 single-length
+            (0x25,
+             [
+                 dut.FixedLengthParameter(dut.PID(0x0105), b'\x99'),
+                 dut.FixedLengthParameter(dut.PID(0x0105), b'\x99')
+             ],
+             b'\x25\xff\x05\x99\x05\x99\xa0'),
+            # P1 fixed, variable and data link escape together
+            (0x80,
+             [
+                 dut.FixedLengthParameter(dut.PID(0x84), b'\x01\x02'),
+                 dut.VariableLengthParameter(dut.PID(0xc2), b'abc'),
+                 dut.DataLinkEscapeParameter(dut.PID(254), 0x20, b'xy')
+             ],
+             b'\x80\x84\x01\x02\xc2\x03abc\xfe\x20xy\xff'),
+            # single P2 empty variable-length
+            (0x80,
+             [
+                 dut.VariableLengthParameter(dut.PID(0x01c2), b'')
+             ],
+             b'\x80\xff\xc2\x00\xbf'),
+            # single P1 variable-length, zero-padded to its declared length
+            (1,
+             [
+                 dut.VariableLengthParameter(dut.PID(0xc0), b'ab', 4)
+             ],
+             b'\x01\xc0\x04\x00\x00ab\x78'),
+            # TODO lots more cases
+        ]
+        cls._built = [(dut.Message(mid, params), b)
+                      for mid, params, b in cls.test_cases]
 
+    def test_mid_out_of_range(self):
         # bad mids should ValueError out of range
         for i in [-1, 256, 999]:
-            with self.assertRaises(ValueError):
+            with self.subTest(i=i), self.assertRaises(ValueError):
                 dut.Message(i, [])
 
+    def test_mid_valid(self):
         # good mids should expose the property
         for i in [0, 1, 127, 128, 255]:
-            m = dut.Message(i, [])
-            self.assertEqual(m.mid, i)
+            with self.subTest(i=i):
+                self.assertEqual(dut.Message(i, []).mid, i)
 
     def test_mid_as_bytes(self):
         # good mids should expose the property as_bytes
@@ -228,9 +424,9 @@ class TestMessage(unittest.TestCase):
                            (0x7f, b'\x7f'),
                            (0x80, b'\x80'),
                            (0xff, b'\xff')]:
-            m = dut.Message(i, [])
-            self.assertEqual(m.mid_as_bytes,
-                             i.to_bytes(1, dut._LITTLE_ENDIAN))
+            with self.subTest(i=i):
+                m = dut.Message(i, [])
+                self.assertEqual(m.mid_as_bytes, bytes_i)
 
     def test_unrepresentable(self):
         # per the documentation, we should be able to instantiate cases without
@@ -256,49 +452,61 @@ class TestMessage(unittest.TestCase):
         self.assertIs(msg.parameters, l)
 
     def test_to_bytes(self):
-        # if we're going to catch regressions, here's where we're going to do it
-        # special cases ahoy!
-        for pid, params, expected in [
-            # single P1 single-length
-            (0,
-             [
-                 dut.FixedLengthParameter(dut.PID(1), b'\x88')
-             ],
-             b'\x00\x01\x88\x77'),
-            (1,
-             [
-                 dut.FixedLengthParameter(dut.PID(1), b'\x08')
-             ],
-             b'\x01\x01\x08\xf6'),
-            (0x0c,
-             [
-                 dut.FixedLengthParameter(dut.PID(1), b'\x88')
-             ],
-             b'\x0c\x01\x88\x6b'),
-            # double P1 single-length
-            (0,
-             [
-                 dut.FixedLengthParameter(dut.PID(1), b'\x88'),
-                 dut.FixedLengthParameter(dut.PID(1), b'\x88')
-             ],
-             b'\x00\x01\x88\x01\x88\xee'),
-            # single P2 single-length
-            (0x17,
-             [
-                 dut.FixedLengthParameter(dut.PID(0x0105), b'\x99')
-             ],
-             b'\x17\xff\x05\x99\x4c'),
-            # double P2 single-length
-            (0x25,
-             [
-                 dut.FixedLengthParameter(dut.PID(0x0105), b'\x99'),
-                 dut.FixedLengthParameter(dut.PID(0x0105), b'\x99')
-             ],
-             b'\x25\xff\x05\x99\x05\x99\xa0'),
-            # TODO lots more cases
+        for msg, expected in self._built:
+            with self.subTest(expected=expected):
+                self.assertEqual(msg.to_bytes(), expected)
+
+    def test_from_bytes(self):
+        for expected, b in self._built:
+            with self.subTest(b=b):
+                msg = dut.Message.from_bytes(b)
+                self.assertEqual(msg.mid, expected.mid)
+                self.assertEqual([type(p) for p in msg.parameters],
+                                 [type(p) for p in expected.parameters])
+                # compared by encoding, since any zero padding is read back
+                # as part of the value
+                self.assertEqual(
+                    [(p.pid, p.to_bytes()) for p in msg.parameters],
+                    [(p.pid, p.to_bytes()) for p in expected.parameters])
+                self.assertEqual(msg.to_bytes(), b)
+
+    def test_from_bytes_invalid(self):
+        for s in [
+            # bad checksum
+            b'\x00\x01\x88\x78',
+            # no parameters
+            b'\x00\x00',
+            b'\x00\xff\x01',
+            # truncated parameters
+            b'\x00\x01\xff',
+            b'\x00\x80\x01\x7f',
+            b'\x00\xc0\x05abx',
+            b'\x00\xfe\x02',
+            # truncated PID following a complete parameter
+            b'\x00\x01\x88\x01\x76',
+            b'\x00\x01\x88\xfe\x79',
+            b'\x00\x01\x88\xc0\xb7',
+            # page-2 extension
+            b'\x00\xff\xff\x01\x01',
+            # overlength
+            b'\x00' + b'\x01\x01' * 10 + b'\xec',
         ]:
-            msg = dut.Message(pid, params)
-            self.assertEqual(msg.to_bytes(), expected)
+            with self.subTest(s=s), self.assertRaises(ValueError):
+                dut.Message.from_bytes(s)
+
+    def test_freeze(self):
+        params = [dut.FixedLengthParameter(dut.PID(1), b'\x88')]
+        msg = dut.Message(0, params)
+        self.assertIs(msg.freeze(), msg)
+        self.assertEqual(msg.parameters, tuple(params))
+        self.assertEqual(msg.to_bytes(), b'\x00\x01\x88\x77')
+        self.assertIs(msg.to_bytes(), msg.to_bytes())
+
+        # unrepresentable messages should fail to freeze, and stay unfrozen
+        msg = dut.Message(1, [])
+        with self.assertRaises(ValueError):
+            msg.freeze()
+        self.assertEqual(msg.parameters, [])
 
     @staticmethod
     def _parameter_from_pid(pid: dut.PID) -> dut.Parameter:
@@ -315,92 +523,63 @@ class TestMessage(unittest.TestCase):
             raise RuntimeError('should be unreachable')
 
     def test_check_parameters(self):
-
-        # empty list should ValueError
-        with self.assertRaises(ValueError):
-            dut.Message.check_parameters([])
-
-        # list of only extended params should return True
-        self.assertTrue(dut.Message.check_parameters([
-            self._parameter_from_pid(dut.PID(i))
-            for i in TestPID.EXTENDED_PIDS
-        ]))
-
-        # list of only unextended params should return False
-        self.assertFalse(dut.Message.check_parameters([
-            self._parameter_from_pid(dut.PID(i))
-            for i in TestPID.UNEXTENDED_PIDS
-        ]))
-
-        # list of mixed extended and unextended params should ValueError
-        with self.assertRaises(ValueError):
-            dut.Message.check_parameters([
-                self._parameter_from_pid(dut.PID(i))
-                for i in [*TestPID.UNEXTENDED_PIDS,
-                          *TestPID.EXTENDED_PIDS]
-            ])
-
-        # lists with non-Parameter instances should ValueError
-        for parameters in [
-            [*[self._parameter_from_pid(dut.PID(i))
-               for i in TestPID.EXTENDED_PIDS],
-             None]
-        ]:
-            with self.assertRaises(ValueError):
-                dut.Message.check_parameters(parameters)
-
-        # list of one DataLinkEscapeParameter should pass
-        dut.Message.check_parameters([
-            self._parameter_from_pid(dut.PID(TestPID.DLESCAPE_PIDS[0]))
-        ])
-
-        # list with DataLinkEscapeParameter at end should pass
-        dut.Message.check_parameters([
-            self._parameter_from_pid(dut.PID(TestPID.SINGLE_LENGTH_PIDS[0])),
-            self._parameter_from_pid(dut.PID(TestPID.DLESCAPE_PIDS[0])),
-        ])
-
-        # list with DataLinkEscapeParameter not at end should fail
-        with self.assertRaises(ValueError):
-            dut.Message.check_parameters([
-                self._parameter_from_pid(
-                    dut.PID(TestPID.SINGLE_LENGTH_PIDS[0])),
-                self._parameter_from_pid(dut.PID(TestPID.DLESCAPE_PIDS[0])),
-                self._parameter_from_pid(
-                    dut.PID(TestPID.SINGLE_LENGTH_PIDS[0])),
-            ])
-
-        # list with two DataLinkEscapeParameters should fail
-        with self.assertRaises(ValueError):
-            dut.Message.check_parameters([
-                self._parameter_from_pid(dut.PID(TestPID.DLESCAPE_PIDS[0])),
-                self._parameter_from_pid(dut.PID(TestPID.DLESCAPE_PIDS[0])),
-            ])
+        single, dlescape = self._single, self._dlescape
+        # (description, parameters, expected return or ValueError)
+        cases = [
+            ('empty', [], ValueError),
+            ('only extended', self._extended, True),
+            ('only unextended', self._unextended, False),
+            ('mixed extended and unextended',
+             [*self._unextended, *self._extended], ValueError),
+            ('non-Parameter instance', [*self._extended, None], ValueError),
+            ('Parameter look-alike', [unittest.mock.Mock()], ValueError),
+            ('single DataLinkEscapeParameter', [dlescape], False),
+            ('DataLinkEscapeParameter at end', [single, dlescape], False),
+            ('DataLinkEscapeParameter not at end',
+             [single, dlescape, single], ValueError),
+            ('two DataLinkEscapeParameters', [dlescape, dlescape], ValueError),
+        ]
+        for description, parameters, expected in cases:
+            with self.subTest(description):
+                if expected is ValueError:
+                    with self.assertRaises(ValueError):
+                        dut.Message.check_parameters(parameters)
+                else:
+                    self.assertIs(dut.Message.check_parameters(parameters),
+                                  expected)
 
     def test_calc_checksum(self):
-        for s, checksum in [
-            (b'\x00', 0x00),
-            (b'\x01', 0xff),
-            (b'\xff', 0x01),
-            (b'\x00\x01', 0xff),
-            (b'\x01\x00', 0xff),
-            (b'\x01\x01', 0xfe),
-            (b'\xfe\x01\x01', 0x00),
-        ]:
-            self.assertEqual(dut.Message.calc_checksum(s), checksum)
+        for s, checksum, _ in CHECKSUM_FIXTURES:
+            with self.subTest(s=s):
+                self.assertEqual(dut.Message.calc_checksum(s), checksum)
+
+    def test_calc_checksum_bulk(self):
+        # the checksum should match the negation table and bring the sum of any
+        # message to a multiple of 256, over every length a message body can
+        # have, from empty to 20 bytes
+        rng = random.Random(0)
+        for _ in range(10000):
+            s = bytes(rng.randrange(256) for _ in range(rng.randrange(21)))
+            with self.subTest(s=s):
+                checksum = dut.Message.calc_checksum(s)
+                self.assertEqual(checksum, NEGATED_BYTES[sum(s) % 256])
+                self.assertEqual((sum(s) + checksum) % 256, 0)
+
+    def test_checksum_roundtrip(self):
+        # stripping an appended checksum should recover any allowable string
+        rng = random.Random(0)
+        for _ in range(10000):
+            s = bytes(rng.randrange(256) for _ in range(rng.randrange(21)))
+            with self.subTest(s=s):
+                self.assertEqual(
+                    dut.Message.strip_checksum(dut.Message.append_checksum(s)),
+                    s)
 
     def test_append_checksum(self):
         # normal cases should work
-        for s, sc in [
-            (b'\x00', b'\x00\x00'),
-            (b'\x01', b'\x01\xff'),
-            (b'\xff', b'\xff\x01'),
-            (b'\x00\x01', b'\x00\x01\xff'),
-            (b'\x01\x00', b'\x01\x00\xff'),
-            (b'\x01\x01', b'\x01\x01\xfe'),
-            (b'\xfe\x01\x01', b'\xfe\x01\x01\x00'),
-        ]:
-            self.assertEqual(dut.Message.append_checksum(s), sc)
+        for s, _, sc in CHECKSUM_FIXTURES:
+            with self.subTest(s=s):
+                self.assertEqual(dut.Message.append_checksum(s), sc)
 
         # and overlength cases should throw
         with self.assertRaises(ValueError):
@@ -408,28 +587,15 @@ class TestMessage(unittest.TestCase):
 
     def test_strip_checksum(self):
         # strings s with correct checksum should return s[:-1]
-        for s in [
-            b'\x00\x00',
-            b'\x01\xff',
-            b'\xff\x01',
-            b'\x00\x01\xff',
-            b'\x01\x00\xff',
-            b'\x01\x01\xfe',
-            b'\xfe\x01\x01\x00',
-        ]:
-            self.assertEqual(dut.Message.strip_checksum(s), s[:-1])
+        for _, _, s in CHECKSUM_FIXTURES:
+            with self.subTest(s=s):
+                self.assertEqual(dut.Message.strip_checksum(s), s[:-1])
 
         # and strings with incorrect checksum should throw
-
-        for s in [
-            b'\x00\x01',
-            b'\x00\xff',
-            b'\x01\xfe',
-            b'\xff\x11',
-            b'\x00\x01\x69',
-            b'\x01\x00\xfe',
-            b'\x01\x01\xff',
-            b'\xfe\x01\x01\x01',
-        ]:
-            with self.assertRaises(ValueError):
+        for s in BAD_CHECKSUM_CASES:
+            with self.subTest(s=s), self.assertRaises(ValueError):
                 dut.Message.strip_checksum(s)
+
+        # as should an empty string, which has no checksum to strip
+        with self.assertRaises(ValueError):
+            dut.Message.strip_checksum(b'')